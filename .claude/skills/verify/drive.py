@@ -0,0 +1,50 @@
+"""Headless end-to-end driver for Ferret (see SKILL.md)."""
+import os, sys
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+REPO = os.path.dirname(os.path.abspath(__file__ + '/../../../'))
+os.chdir(REPO)
+if not os.path.exists('/tmp/pkg/Ferret'):
+    os.makedirs('/tmp/pkg', exist_ok=True)
+    os.symlink(REPO, '/tmp/pkg/Ferret')
+sys.path.insert(0, '/tmp/pkg')
+for sub in ('Developer/ModelLibrary', 'Developer/ModelLibrary/SupportModules', 'Core'):
+    p = os.path.join(REPO, sub)
+    if p not in sys.path:
+        sys.path.append(p)
+
+from Ferret.Ferret import Ferret
+from PyQt5.QtWidgets import QApplication, QMainWindow
+
+modelLibrary = sys.argv[1] if len(sys.argv) > 1 else 'SimpleModels'
+dataFile = sys.argv[2] if len(sys.argv) > 2 else 'FerretData/SimpleModelData.csv'
+modelIndex = int(sys.argv[3]) if len(sys.argv) > 3 else 1
+
+lib = __import__(modelLibrary)
+app = QApplication([])
+window = QMainWindow()
+w = Ferret(statusBar=window.statusBar(),
+           dataFileFolder=lib.returnDataFileFolder(),
+           modelList=lib.returnModelList())
+window.setCentralWidget(w)
+window.show()
+print("CHECK GUI constructed")
+w.loadDataWidget.LoadDataFile(dataFile)
+print("CHECK data loaded:", list(w.signalData.keys()))
+w.cmbModels.setCurrentIndex(modelIndex)
+w.cmbModels.activated.emit(modelIndex)
+print("CHECK model selected:", w.currentModelObject)
+for i, combo in enumerate(w.variableComboList):
+    idx = min(i + 1, combo.count() - 1)
+    combo.setCurrentIndex(idx)
+    combo.activated.emit(idx)
+print("CHECK variables:", [c.currentText() for c in w.variableComboList])
+w.lineGraph.plotGraph()
+print("CHECK plotGraph, model points:", len(w.listModelPredictedValues))
+w.lineGraph.curveFit()
+print("CHECK curveFit:", {k: v for k, v in w.optimisedParamaterDict.items()})
+w.groupBoxExport.saveCSVFile('/tmp/out.csv')
+print("CHECK csv export:")
+print(open('/tmp/out.csv').read()[:240])
+w.groupBoxExport.createPDFReport('/tmp/report.pdf')
+print("CHECK pdf report:", os.path.exists('/tmp/report.pdf'), os.path.getsize('/tmp/report.pdf') if os.path.exists('/tmp/report.pdf') else 0)
@@ -1,375 +1,688 @@
-"""
-This module contains functions that: 
-1. Plot MR signal/time curves on a graph.
-2. Calculate and plot the signal/time curve predicted by a mathematical model.
-3. Fit the curve predicted by a mathematical model to the experimental data.
-4. Calculate the 95% confidence limits associated with the curve fitting.
-"""
-__author__ = "Steve Shillitoe"
-__version__ = "1.0"
-__date__ = "Date: 2022/04/26"
-from PyQt5 import QtCore
-from PyQt5.QtWidgets import QMessageBox, QApplication
-from PyQt5.QtGui import QCursor
-import numpy as np
-import logging
-from lmfit import Parameters, Model
-from scipy.stats.distributions import  t
-from LineGraph import LineGraph
-from SupportModules.GraphSupport import LineColours
-from FerretConstants import FerretConstants
-
-#Create and configure the logger
-#First delete the previous log file if there is one
-LOG_FILE_NAME = "Activity_Log_File.log"
-LOG_FORMAT = "%(levelname)s %(asctime)s - %(message)s"
-logging.basicConfig(filename=LOG_FILE_NAME, 
-                    level=logging.INFO, 
-                    format=LOG_FORMAT)
-logger = logging.getLogger(__name__)
-
-class FerretPlotData(LineGraph):
-    """
-    This class inherits from the LineGraph class to provide signal/time 
-    curve plotting functionality.
-
-    Additionality it provides functionality for calculating and plotting
-    a signal/time curve according to a mathematical model. 
-
-    If plot width = 4,  plot height = 6 and dots per inch is 75 then
-        the plot would be 300 and 450 pixels in size.
-
-        Input arguments.
-        ****************
-        plotWidth - width of the plot in inches 
-        plotHeight - height of the plot in inches 
-        dotsPerInch - number of pixels per inch 
-        xLabel - string containing the X axis label  
-        yLabel - string containing the Y axis label  
-        title  - string containing the title of the graph displayed above the graph.
-        tickLabelSize - size of the axis ticks.
-        xyAxisLabelSize - size of the X & Y axis labels.
-        titleSize - size of the title.
-        backgroundColour - optional parameter for selecting the plot background colour.
-                            default value is 'w' for white
-    """
-    sigGetPlotData =  QtCore.Signal()
-    sigGetCurveFitData =  QtCore.Signal()
-    sigReturnListModelConcentrations = QtCore.Signal(np.ndarray)
-    sigCurveFittingComplete = QtCore.Signal(dict)
-    sigReturnOptimumParamDict = QtCore.Signal(dict)
-    sigMessageReturnedFromSolver = QtCore.Signal(str)
-
-    def __init__(self, plotWidth=4, plotHeight=7, 
-                 dotsPerInch=300, xLabel='time', 
-                 yLabel='signal', title='Signal/Time Curves',
-                 tickLabelSize=2,
-                 xyAxisLabelSize=5,
-                 titleSize=6,
-                 backgroundColour='w'):
-        super().__init__(plotWidth, plotHeight, 
-                 dotsPerInch, xLabel, 
-                 yLabel, title,
-                 tickLabelSize,
-                 xyAxisLabelSize,
-                 titleSize,
-                 backgroundColour)
-        #dictionary of lists, where name=signal type, value= array of corresponding MR signals
-        self._signalData = {} 
-        self._currentModelObject = None
-        #list of model parameter values
-        self._parameterList = []
-        #list of optimum parameter values for best fit of model curve to a data curve
-        self._curveFitParameterList = []
-        #list of checkbox widgets that indicate 
-        #if a parameter should be fixed during curve fitting
-        self._parameterFixedCheckBoxList = []
-        #string of constants used by the model
-        self._constantsString = None
-
-
-    def setConstantsString(self, strConstants):
-        self._constantsString = strConstants
-
-
-    def setParameterFixedCheckBoxList(self, checkBoxList):
-        self._parameterFixedCheckBoxList = checkBoxList
-
-
-    def setCurveFitParameterList(self, paramList):
-        self._curveFitParameterList = paramList
-
-
-    def setSignalData(self, signalData):
-        self._signalData = signalData
-
-
-    def setCurrentModelObject(self, currentModelObject):
-        self._currentModelObject = currentModelObject
-
-
-    def setParameterList(self, paramList):
-        self._parameterList = paramList
-
-
-    def clearGraph(self):
-        self.clearPlot()
-
-
-    def plotGraph(self):  
-        """
-        This function plots the normalised signal against time curves 
-        for each variable in the model objects variables list.
-        It also plots the normalised signal/time curve predicted by the 
-        selected model.
-        """
-        try:
-            logger.info('function FerretPlotData.plotGraph called')
-            self.clearPlot()
-            self.sigGetPlotData.emit()
-            self.arrayTimes = np.array(self._signalData['time'], dtype='float')
-            for variable in self._currentModelObject.variablesList:
-                self.plotSignal(variable.value, variable.plotLineColour)
-            self.plotModel()
-        except Exception as e:
-                print('Error in function FerretPlotData plotGraph : ' + str(e))
-                logger.error('Error in function FerretPlotData plotGraph : ' + str(e) )
-
-
-    def calculateAndPlotModelCurve(self, modelFunction, 
-                       arrayTimes, 
-                       arrayModelInputSignals, 
-                       parameterArray,
-                       xDataInputOnly=False):
-        """
-        Using the function, modelFunction, and its inputs:
-         arrayModelInputSignals
-         parameterArray
-        this function calculates a MR signal/time curve 
-        and plots it on the matplotlib plot.
-
-        Inputs
-        ------
-        modelFunction - function object containing mathematical model 
-        arrayTimes - array of time points over which the
-                MR signal data is recorded.
-        arrayModelInputSignals - array of AIF MR signal data over
-                the time period stored in arrayTimes.
-        """
-        try:
-            logger.info('calculateAndPlotModelCurve called')
-
-            if xDataInputOnly:
-                timeInputConcs2DArray = arrayTimes
-            else:
-                timeInputConcs2DArray = np.column_stack((arrayTimes, arrayModelInputSignals))
-                    
-            listModelConcentrations = modelFunction(timeInputConcs2DArray, *parameterArray, self._constantsString)
-            if self._currentModelObject.returnMessageFunction is not None:
-                self.sigMessageReturnedFromSolver.emit(self._currentModelObject.returnMessageFunction())
-            if listModelConcentrations is not None:
-                self.plotData(arrayTimes, listModelConcentrations, 
-                                        lineStyle=LineColours.greenDashed, 
-                                        labelText= 'model')
-                self.sigReturnListModelConcentrations.emit(listModelConcentrations)
-        except Exception as e:
-                print('Error in function FerretPlotData.calculateAndPlotModelCurve ' + str(e) )
-                logger.error('Error in function FerretPlotData calculateAndPlotModelCurve ' + str(e) )
-    
-    
-    def plotSignal(self, signalType, lineStyle):
-        """
-        This function plots the signal/time curve for the variable, signalType
-        """
-        try:
-            if signalType != FerretConstants.PLEASE_SELECT and signalType is not None:
-                arraySignals = np.array(self._signalData[signalType], dtype='float')
-                self.plotData(xData=self.arrayTimes, 
-                                        yData= arraySignals, 
-                                        lineStyle=lineStyle, 
-                                        labelText=signalType)
-        except Exception as e:
-            print("Error in FerretPlotData.plotSignal: " + str(e))
-
-                                
-    def plotModel(self): 
-        """
-        This function plots the signal/time curve predicted by the model.
-
-        First it gets the appropriate array of signal/time values for the
-        input variable to the model.  Then it calls self.calculateAndPlotModelCurve. 
-        """
-        try:
-            arrayModelInputSignals = []  
-            if self._currentModelObject:
-                modelInputValue = self._currentModelObject.getValueOfInputVariableToModel()
-                if modelInputValue:
-                    arrayModelInputSignals = np.array(self._signalData[modelInputValue], dtype='float')
-                    self.calculateAndPlotModelCurve(self._currentModelObject.modelFunction, 
-                                                                self.arrayTimes, 
-                                                                arrayModelInputSignals,  
-                                                                self._parameterList,
-                                                                self._currentModelObject.xDataInputOnly)  
-        except Exception as e:
-            print("Error in FerretPlotData.plotModel: " + str(e))
-
-
-    def curveFit(self): 
-        """
-        This function fits the signal/time curve calculated by 
-        the model to a signal/time curve of experimental data.
-
-        The best fit is obtained by adjusting the model's 
-        input parameters. These optimum model 
-        input parameters are displayed on the GUI 
-        and  the line of best fit plotted on the graph on the GUI.
-        
-        Additionally, the 95% confidence limits of the optimal parameter values  
-        are determined.
-        """
-        try:
-            # Get the name of the model to be fitted to the ROI curve
-            modelName = self._currentModelObject.shortName
-            # Form inputs to the curve fitting function
-            self.sigGetCurveFitData.emit()
-            modelParams = Parameters()
-            modelParams.add_many(*self._curveFitParameterList) 
-            #Uncomment the statement below to check parameters 
-            #loaded ok into the Parameter object
-            #print(modelParams.pretty_print())
-            
-            # Get arrays of data corresponding to the above 3 regions 
-            # and the time over which the measurements were made.
-            curveToFitTo = self._currentModelObject.getNameOfCurveToFitTo()
-            arrayFitCurveToSignals = np.array(self._signalData[curveToFitTo], dtype='float')
-            modelInputValue = self._currentModelObject.getValueOfInputVariableToModel()
-            arrayModelInputSignals = np.array(self._signalData[modelInputValue], dtype='float')
-
-            if self._currentModelObject.xDataInputOnly:
-                timeInputConcs2DArray = self.arrayTimes
-            else:
-                timeInputConcs2DArray = np.column_stack((self.arrayTimes, arrayModelInputSignals))
-            
-            QApplication.setOverrideCursor(QCursor(QtCore.Qt.WaitCursor))
-            objModel = Model(self._currentModelObject.modelFunction, \
-            independent_vars=['inputData', 'constantsString'])
-
-            bestFitResults = objModel.fit(data=arrayFitCurveToSignals, 
-                                  params=modelParams, 
-                                  inputData=timeInputConcs2DArray, 
-                                  constantsString=self._constantsString)
-
-            if self._currentModelObject.returnMessageFunction is not None:
-                self.sigMessageReturnedFromSolver.emit(self._currentModelObject.returnMessageFunction())
-
-            self.sigCurveFittingComplete.emit(bestFitResults.best_values)
-            QApplication.restoreOverrideCursor()
-            logger.info('curveFit returned optimum parameters {}'
-                        .format(bestFitResults.best_values))
-            # Plot the best curve on the graph
-            self.plotGraph()
-           
-            # Determine 95% confidence limits.
-            numDataPoints = arrayFitCurveToSignals.size
-            numParams = len(list(bestFitResults.best_values.values()))
-            if bestFitResults.covar.size:
-                self._CurveFitCalculate95ConfidenceLimits(numDataPoints, numParams, 
-                                    bestFitResults.best_values, bestFitResults.covar)
-        except RuntimeWarning as rtw:
-            print ("Runtime Warning : " + str(rtw))
-        except ValueError as ve:
-            print ('Value Error: curveFit with model ' + modelName + ': '+ str(ve))
-            logger.error('Value Error: curveFit with model ' + modelName + ': '+ str(ve))
-        except Exception as e:
-            print('Error in function FerretPlotData.curveFit with model ' + modelName + ': ' + str(e))
-            logger.error('Error in function FerretPlotData.curveFit with model ' + modelName + ': ' + str(e))
-   
-
-    def _CurveFitCalculate95ConfidenceLimits(self, numDataPoints: int, 
-                                            numParams: int, 
-                                            optimumParams, 
-                                            bestFitResultsCovar):
-        """Calculates the 95% confidence limits of optimum 
-        parameter values resulting from curve fitting. 
-
-        The the 95% confidence limits are passed back to the
-        Ferret GUI for use in the creation of the PDF report
-        and for display  on the GUI.
-        
-        Input Parameters
-        ----------------
-        numDataPoints -  Number of data points to which the model is fitted.
-                Taken as the number of elements in the array of ROI data.
-        numParams - Number of model input parameters.
-        optimumParams - Array of optimum model input parameter values 
-                        resulting from curve fitting.
-        bestFitResults.covar - The estimated covariance of 
-                the values in optimumParams calculated during 
-                curve fitting.
-        """
-        try:
-            logger.info('Function FerretPlotData._CurveFitCalculate95ConfidenceLimits called: numDataPoints ={}, numParams={}, optimumParams={}, bestFitResults.covar={}'
-                        .format(numDataPoints, numParams, optimumParams, bestFitResultsCovar))
-            alpha = 0.05 # 95% confidence interval = 100*(1-alpha)
-            originalOptimumParams = optimumParams.copy()
-            originalNumParams = numParams
-
-            # Check for fixed parameters.
-            # Removed fixed parameters from the optimum parameter list
-            # as they should not be included in the calculation of
-            # confidence limits
-            for objCheckBox in self._parameterFixedCheckBoxList:
-                if objCheckBox.isChecked():
-                    del optimumParams[objCheckBox.shortName]
-                    
-            numDegsOfFreedom = max(0, numDataPoints - numParams) 
-        
-            # student-t value for the degrees of freedom and the confidence level
-            tval = t.ppf(1.0-alpha/2., numDegsOfFreedom)
-        
-            # Remove results of previous curve fitting
-            optimisedParamaterDict = {}
-            optimumParamsList = list(optimumParams.values())
-            for counter, paramValue, var in zip(range(numDataPoints), optimumParamsList, np.diag(bestFitResultsCovar)):
-                # Calculate 95% confidence interval for each parameter 
-                # allowed to vary and add these to a list
-                key = list(optimumParams.keys())[list(optimumParams.values()).index(paramValue)]
-                units = self._currentModelObject.getParameterUnits(key)
-                tempList = []
-                sigma = var**0.5
-                lower = paramValue - sigma*tval
-                upper = paramValue + sigma*tval
-                if units == "%":
-                    paramValue = paramValue * 100
-                    lower = lower * 100.0
-                    upper = upper * 100.0
-                tempList.append(round(paramValue,4))
-                tempList.append(round(lower,4))
-                tempList.append(round(upper,4))
-                tempList.append(units)
-                optimisedParamaterDict[key] = tempList
-                
-            # Now insert fixed parameters into optimisedParameterList
-            # if there are any.
-            for objCheckBox in self._parameterFixedCheckBoxList:
-                if objCheckBox.isChecked():
-                    # Add the fixed optimum parameter value to a list
-                    fixedParamValue = originalOptimumParams[objCheckBox.shortName]
-                    units = self._currentModelObject.getParameterUnits(objCheckBox.shortName)
-                    if units == "%":
-                        fixedParamValue = fixedParamValue * 100
-                    lower = ''
-                    upper = ''
-                    tempList = [fixedParamValue, lower, upper, units]
-                    # Now add this list to the list of lists 
-                    optimisedParamaterDict[objCheckBox.shortName] = tempList
-            #Return results to the Ferret GUI
-            self.sigReturnOptimumParamDict.emit(optimisedParamaterDict)
-            logger.info('Leaving FerretPlotData._CurveFitCalculate95ConfidenceLimits, optimisedParamaterDict = {}'.format(optimisedParamaterDict))
-        except RuntimeError as rte:
-            print('Runtime Error in function FerretPlotData._CurveFitCalculate95ConfidenceLimits ' + str(rte))
-            logger.error('Runtime Error in function FerretPlotData._CurveFitCalculate95ConfidenceLimits '  + str(rte))  
-        except Exception as e:
-            print('Error in function FerretPlotData._CurveFitCalculate95ConfidenceLimits ' + str(e))
-            logger.error('Error in function FerretPlotData._CurveFitCalculate95ConfidenceLimits '  + str(e))  
-    
+"""
+This module contains functions that: 
+1. Plot MR signal/time curves on a graph.
+2. Calculate and plot the signal/time curve predicted by a mathematical model.
+3. Fit the curve predicted by a mathematical model to the experimental data.
+4. Calculate the 95% confidence limits associated with the curve fitting.
+"""
+__author__ = "Steve Shillitoe"
+__version__ = "1.0"
+__date__ = "Date: 2022/04/26"
+from PyQt5 import QtCore
+from PyQt5.QtWidgets import QMessageBox, QApplication
+from PyQt5.QtGui import QCursor
+import numpy as np
+import logging
+from lmfit import Parameters, Model
+from scipy.stats.distributions import  t
+from LineGraph import LineGraph
+from SupportModules.GraphSupport import LineColours
+from FerretConstants import FerretConstants
+
+#Create and configure the logger
+#First delete the previous log file if there is one
+LOG_FILE_NAME = "Activity_Log_File.log"
+LOG_FORMAT = "%(levelname)s %(asctime)s - %(message)s"
+logging.basicConfig(filename=LOG_FILE_NAME, 
+                    level=logging.INFO, 
+                    format=LOG_FORMAT)
+logger = logging.getLogger(__name__)
+
+class _FitWorker(QtCore.QObject):
+    """
+    Runs a prepared, GUI-free fit callable on a worker thread and
+    reports the outcome via signals (see FerretPlotData.curveFitAsync).
+    """
+    sigFitFinished = QtCore.Signal(object)
+    sigFitFailed = QtCore.Signal(str)
+
+    def __init__(self, fitFunction):
+        super().__init__()
+        self._fitFunction = fitFunction
+
+    def run(self):
+        try:
+            self.sigFitFinished.emit(self._fitFunction())
+        except Exception as e:
+            self.sigFitFailed.emit(str(e))
+
+
+class FerretPlotData(LineGraph):
+    """
+    This class inherits from the LineGraph class to provide signal/time 
+    curve plotting functionality.
+
+    Additionality it provides functionality for calculating and plotting
+    a signal/time curve according to a mathematical model. 
+
+    If plot width = 4,  plot height = 6 and dots per inch is 75 then
+        the plot would be 300 and 450 pixels in size.
+
+        Input arguments.
+        ****************
+        plotWidth - width of the plot in inches 
+        plotHeight - height of the plot in inches 
+        dotsPerInch - number of pixels per inch 
+        xLabel - string containing the X axis label  
+        yLabel - string containing the Y axis label  
+        title  - string containing the title of the graph displayed above the graph.
+        tickLabelSize - size of the axis ticks.
+        xyAxisLabelSize - size of the X & Y axis labels.
+        titleSize - size of the title.
+        backgroundColour - optional parameter for selecting the plot background colour.
+                            default value is 'w' for white
+    """
+    sigGetPlotData =  QtCore.Signal()
+    sigGetCurveFitData =  QtCore.Signal()
+    sigReturnListModelConcentrations = QtCore.Signal(np.ndarray)
+    sigCurveFittingComplete = QtCore.Signal(dict)
+    sigReturnOptimumParamDict = QtCore.Signal(dict)
+    sigMessageReturnedFromSolver = QtCore.Signal(str)
+    #emitted when a fit has finished, successfully or not, so the GUI
+    #can re-enable its fitting controls
+    sigFitEnded = QtCore.Signal()
+
+    #wait cursor shown during curve fitting, built once on first use
+    #(a QCursor cannot be constructed before the QApplication exists)
+    #rather than constructing a QCursor on every fit
+    _WAIT_CURSOR = None
+
+    def __init__(self, plotWidth=4, plotHeight=7, 
+                 dotsPerInch=96, xLabel='time', 
+                 yLabel='signal', title='Signal/Time Curves',
+                 tickLabelSize=2,
+                 xyAxisLabelSize=5,
+                 titleSize=6,
+                 backgroundColour='w'):
+        super().__init__(plotWidth, plotHeight, 
+                 dotsPerInch, xLabel, 
+                 yLabel, title,
+                 tickLabelSize,
+                 xyAxisLabelSize,
+                 titleSize,
+                 backgroundColour)
+        #signal data stored as one contiguous block, one row per signal
+        #type, with a name -> row index map.  Each signal type is read
+        #as a zero-copy view of the block.
+        self._signalMatrix = None
+        self._signalMatrixF32 = None
+        self._signalIndex = {}
+        self._signalViews = {}
+        self._signalDataSource = None
+        self._currentModelObject = None
+        #list of model parameter values
+        self._parameterList = []
+        #list of optimum parameter values for best fit of model curve to a data curve
+        self._curveFitParameterList = []
+        #list of checkbox widgets that indicate 
+        #if a parameter should be fixed during curve fitting
+        self._parameterFixedCheckBoxList = []
+        #string of constants used by the model
+        self._constantsString = None
+        #persistent (N,2) buffer of times and model input signals,
+        #refilled in place instead of being reallocated on every
+        #plot or fit
+        self._timeInputConcs2DArray = None
+        #cache of model curve evaluations keyed on the model inputs,
+        #so that replotting with unchanged parameters (e.g. straight
+        #after curve fitting) does not re-run the model function
+        self._modelEvaluationCache = {}
+        #worker thread used by curveFitAsync
+        self._fitThread = None
+        self._fitWorker = None
+        #the (curve labels, sample count) last plotted, so refreshes
+        #that keep the same composition update the existing Line2D
+        #artists in place instead of rebuilding the figure
+        self._lastPlotComposition = None
+
+
+    def setConstantsString(self, strConstants):
+        self._constantsString = strConstants
+
+
+    def setParameterFixedCheckBoxList(self, checkBoxList):
+        self._parameterFixedCheckBoxList = checkBoxList
+
+
+    def setCurveFitParameterList(self, paramList):
+        self._curveFitParameterList = paramList
+
+
+    def setSignalData(self, signalData):
+        # The GUI hands the same dictionary back on every plot
+        # refresh; the block only needs rebuilding when the data
+        # actually changed (a new file was loaded).  Stable array
+        # identities also let the evaluation caches downstream
+        # recognise unchanged inputs.
+        if signalData is self._signalDataSource:
+            return
+        self._signalDataSource = signalData
+        # Stack the signal columns into one contiguous float64 block,
+        # one row per signal type, so the plot and fit paths stream
+        # zero-copy views of a single cache-friendly allocation.
+        # Empty entries (the 'model' placeholder) are skipped.
+        names = [key for key, value in signalData.items() if len(value)]
+        if names:
+            self._signalMatrix = np.vstack(
+                [np.asarray(signalData[name], dtype=np.float64) for name in names])
+        else:
+            self._signalMatrix = None
+        self._signalIndex = {name: row for row, name in enumerate(names)}
+        #row views built once, so repeated lookups of the same signal
+        #return the identical array object (stable identity for the
+        #evaluation caches downstream)
+        self._signalViews = {name: self._signalMatrix[row]
+                             for name, row in self._signalIndex.items()}
+        #float32 copy of the block for the render path - visually
+        #identical at screen resolution but half the memory bandwidth.
+        #Curve fitting keeps the float64 block for precision.
+        if self._signalMatrix is not None:
+            self._signalMatrixF32 = self._signalMatrix.astype(np.float32)
+        else:
+            self._signalMatrixF32 = None
+        #force the 2D model input buffer to be rebuilt for the new data
+        self._timeInputConcs2DArray = None
+
+
+    def getSignalArray(self, name):
+        """
+        Returns the array of signals for the signal type, name, as a
+        view of the signal block.
+        """
+        return self._signalViews[name]
+
+
+    def getSignalArrayForPlotting(self, name):
+        """
+        Returns the float32 view of the signals for the signal type,
+        name, used on the render path only.
+        """
+        return self._signalMatrixF32[self._signalIndex[name]]
+
+
+    def setCurrentModelObject(self, currentModelObject):
+        self._currentModelObject = currentModelObject
+
+
+    def setParameterList(self, paramList):
+        self._parameterList = paramList
+
+
+    def clearGraph(self):
+        self._lastPlotComposition = None
+        self.clearPlot()
+
+
+    def _beginGraphRefresh(self, plottableVariables):
+        """
+        Starts a graph refresh: the figure is cleared only when the
+        set of curves to plot (or the data length) differs from the
+        previous refresh.  Otherwise the existing Line2D artists are
+        left in place for plotData to update with set_data, which
+        avoids rebuilding the axes and feeds the blitting fast path.
+        """
+        composition = (tuple(variable.value for variable in plottableVariables),
+                       len(self.arrayTimes))
+        if composition != self._lastPlotComposition:
+            self.clearPlot()
+            self._lastPlotComposition = composition
+
+
+    def _buildTimeInputConcs2DArray(self, arrayTimes, arrayModelInputSignals):
+        """
+        Returns the times and model input signals stacked into one
+        (N,2) array.
+
+        The array is a persistent buffer that is refilled in place,
+        avoiding the allocation np.column_stack would make on every
+        plot or fit.
+        """
+        buffer = self._timeInputConcs2DArray
+        if buffer is None or buffer.shape[0] != arrayTimes.shape[0]:
+            buffer = np.empty((arrayTimes.shape[0], 2), dtype=np.float64)
+            self._timeInputConcs2DArray = buffer
+        buffer[:, 0] = arrayTimes
+        buffer[:, 1] = arrayModelInputSignals
+        return buffer
+
+
+    def _plottableVariables(self):
+        """
+        Returns the model variables that have a data type selected,
+        filtered once per refresh so the per-variable plot calls can
+        assume valid input.
+        """
+        return [variable for variable in self._currentModelObject.variablesList
+                if variable.value is not None
+                and variable.value != FerretConstants.PLEASE_SELECT]
+
+
+    def plotGraph(self):
+        """
+        This function plots the normalised signal against time curves 
+        for each variable in the model objects variables list.
+        It also plots the normalised signal/time curve predicted by the 
+        selected model.
+        """
+        try:
+            self.sigGetPlotData.emit()
+            self.arrayTimes = self.getSignalArray('time')
+            plottableVariables = self._plottableVariables()
+            self._beginGraphRefresh(plottableVariables)
+            for variable in plottableVariables:
+                self.plotSignal(variable.value, variable.plotLineColour)
+            self.plotModel()
+            #build the legend once for all the curves added above
+            self.finalizePlot()
+        except Exception as e:
+                print('Error in function FerretPlotData plotGraph : ' + str(e))
+                logger.error('Error in function FerretPlotData plotGraph : %s', e)
+
+
+    def calculateAndPlotModelCurve(self, modelFunction, 
+                       arrayTimes, 
+                       arrayModelInputSignals, 
+                       parameterArray,
+                       xDataInputOnly=False):
+        """
+        Using the function, modelFunction, and its inputs:
+         arrayModelInputSignals
+         parameterArray
+        this function calculates a MR signal/time curve 
+        and plots it on the matplotlib plot.
+
+        Inputs
+        ------
+        modelFunction - function object containing mathematical model 
+        arrayTimes - array of time points over which the
+                MR signal data is recorded.
+        arrayModelInputSignals - array of AIF MR signal data over
+                the time period stored in arrayTimes.
+        """
+        try:
+            if xDataInputOnly:
+                timeInputConcs2DArray = arrayTimes
+            else:
+                timeInputConcs2DArray = self._buildTimeInputConcs2DArray(arrayTimes, arrayModelInputSignals)
+
+            # The model function is deterministic, so an evaluation
+            # with identical inputs can be reused from the cache
+            cacheKey = (modelFunction,
+                        np.asarray(timeInputConcs2DArray).tobytes(),
+                        tuple(parameterArray),
+                        self._constantsString)
+            listModelConcentrations = self._modelEvaluationCache.get(cacheKey)
+            if listModelConcentrations is None:
+                # evaluate() tracks which parameters changed since the
+                # last call and lets opted-in model functions reuse
+                # cached sub-expressions (see Model.evaluate)
+                listModelConcentrations = self._currentModelObject.evaluate(
+                    timeInputConcs2DArray, parameterArray, self._constantsString)
+                if listModelConcentrations is not None:
+                    if len(self._modelEvaluationCache) >= 128:
+                        self._modelEvaluationCache.clear()
+                    self._modelEvaluationCache[cacheKey] = listModelConcentrations
+            if self._currentModelObject.returnMessageFunction is not None:
+                self.sigMessageReturnedFromSolver.emit(self._currentModelObject.returnMessageFunction())
+            if listModelConcentrations is not None:
+                #render in float32; the full-precision curve is
+                #returned to Ferret for export
+                self.plotData(arrayTimes,
+                                        np.asarray(listModelConcentrations, dtype=np.float32),
+                                        lineStyle=LineColours.greenDashed,
+                                        labelText= 'model')
+                self.sigReturnListModelConcentrations.emit(listModelConcentrations)
+            else:
+                #the model could not be evaluated - do not leave the
+                #previous refresh's model curve on display
+                modelLine = self._lines.get('model')
+                if modelLine is not None:
+                    modelLine.set_visible(False)
+        except Exception as e:
+                print('Error in function FerretPlotData.calculateAndPlotModelCurve ' + str(e) )
+                logger.error('Error in function FerretPlotData calculateAndPlotModelCurve %s', e)
+    
+    
+    def plotSignal(self, signalType, lineStyle):
+        """
+        This function plots the signal/time curve for the variable, signalType.
+
+        The caller is expected to have filtered out unselected
+        variables via _plottableVariables.
+        """
+        try:
+            arraySignals = self.getSignalArrayForPlotting(signalType)
+            self.plotData(xData=self.arrayTimes,
+                                    yData= arraySignals,
+                                    lineStyle=lineStyle,
+                                    labelText=signalType)
+        except Exception as e:
+            print("Error in FerretPlotData.plotSignal: " + str(e))
+
+                                
+    def plotModel(self): 
+        """
+        This function plots the signal/time curve predicted by the model.
+
+        First it gets the appropriate array of signal/time values for the
+        input variable to the model.  Then it calls self.calculateAndPlotModelCurve. 
+        """
+        try:
+            arrayModelInputSignals = []  
+            if self._currentModelObject:
+                modelInputValue = self._currentModelObject.getValueOfInputVariableToModel()
+                if modelInputValue:
+                    arrayModelInputSignals = self.getSignalArray(modelInputValue)
+                    self.calculateAndPlotModelCurve(self._currentModelObject.modelFunction,
+                                                                self.arrayTimes, 
+                                                                arrayModelInputSignals,  
+                                                                self._parameterList,
+                                                                self._currentModelObject.xDataInputOnly)  
+        except Exception as e:
+            print("Error in FerretPlotData.plotModel: " + str(e))
+
+
+    def plotFittedGraph(self, bestFitCurve):
+        """
+        Replots the signal/time curves and the fitted model curve
+        after curve fitting.
+
+        lmfit has already evaluated the model at the optimum
+        parameters, so the best-fit curve is plotted directly instead
+        of re-running the model function as plotGraph would.
+        """
+        try:
+            plottableVariables = self._plottableVariables()
+            self._beginGraphRefresh(plottableVariables)
+            for variable in plottableVariables:
+                self.plotSignal(variable.value, variable.plotLineColour)
+            self.plotData(self.arrayTimes,
+                          np.asarray(bestFitCurve, dtype=np.float32),
+                          lineStyle=LineColours.greenDashed,
+                          labelText='model')
+            self.sigReturnListModelConcentrations.emit(bestFitCurve)
+            #build the legend once for all the curves added above
+            self.finalizePlot()
+        except Exception as e:
+                print('Error in function FerretPlotData plotFittedGraph : ' + str(e))
+                logger.error('Error in function FerretPlotData plotFittedGraph : %s', e)
+
+
+    def _prepareCurveFit(self):
+        """
+        Gathers the inputs for curve fitting from the GUI (main thread
+        only) and returns (runFit, modelName), where runFit is a
+        GUI-free callable that performs the fit and returns the lmfit
+        result.  Returns None if preparation fails.
+        """
+        try:
+            # Bind the pieces of the current model object used below to
+            # locals once, rather than resolving the attribute chain
+            # repeatedly around the fitting loop
+            currentModel = self._currentModelObject
+            modelFunction = currentModel.modelFunction
+            modelName = currentModel.shortName
+            # Form inputs to the curve fitting function
+            self.sigGetCurveFitData.emit()
+            constantsString = self._constantsString
+            modelParams = Parameters()
+            modelParams.add_many(*self._curveFitParameterList)
+
+            # Get arrays of data corresponding to the above 3 regions
+            # and the time over which the measurements were made.
+            curveToFitTo = currentModel.getNameOfCurveToFitTo()
+            arrayFitCurveToSignals = self.getSignalArray(curveToFitTo)
+            modelInputValue = currentModel.getValueOfInputVariableToModel()
+            arrayModelInputSignals = self.getSignalArray(modelInputValue)
+
+            if currentModel.xDataInputOnly:
+                timeInputConcs2DArray = self.arrayTimes
+            else:
+                timeInputConcs2DArray = self._buildTimeInputConcs2DArray(self.arrayTimes, arrayModelInputSignals)
+
+            objModel = Model(modelFunction,
+            independent_vars=['inputData', 'constantsString'])
+
+            def runFit():
+                if currentModel.parallelFit:
+                    # Global optimisation with the residual evaluations
+                    # spread over all CPU cores.  Falls back to the default
+                    # fit if the optimiser rejects the problem (e.g. a
+                    # parameter without finite constraints).
+                    try:
+                        return objModel.fit(data=arrayFitCurveToSignals,
+                                            params=modelParams,
+                                            inputData=timeInputConcs2DArray,
+                                            constantsString=constantsString,
+                                            method='differential_evolution',
+                                            fit_kws={'workers': -1, 'polish': True})
+                    except Exception as fitError:
+                        logger.error('Parallel fit failed (%s), falling back to the default fit', fitError)
+                elif currentModel.modelJacobian is not None:
+                    # An analytic Jacobian saves the extra model
+                    # evaluations the Levenberg-Marquardt backend would
+                    # spend on finite differences.  Falls back to the
+                    # default fit if the backend rejects it.
+                    try:
+                        return objModel.fit(data=arrayFitCurveToSignals,
+                                            params=modelParams,
+                                            inputData=timeInputConcs2DArray,
+                                            constantsString=constantsString,
+                                            method='leastsq',
+                                            fit_kws={'Dfun': currentModel.modelJacobian,
+                                                     'col_deriv': True})
+                    except Exception as fitError:
+                        logger.error('Analytic-Jacobian fit failed (%s), falling back to the default fit', fitError)
+                return objModel.fit(data=arrayFitCurveToSignals,
+                                    params=modelParams,
+                                    inputData=timeInputConcs2DArray,
+                                    constantsString=constantsString)
+
+            return runFit, modelName
+        except Exception as e:
+            print('Error in function FerretPlotData._prepareCurveFit: ' + str(e))
+            logger.error('Error in function FerretPlotData._prepareCurveFit: %s', e)
+            return None
+
+
+    def _completeCurveFit(self, bestFitResults):
+        """
+        Applies the results of a completed fit to the GUI: solver
+        message, optimum parameters, best-fit plot and confidence
+        limits.  Main thread only.
+        """
+        try:
+            currentModel = self._currentModelObject
+            if currentModel.returnMessageFunction is not None:
+                self.sigMessageReturnedFromSolver.emit(currentModel.returnMessageFunction())
+
+            self.sigCurveFittingComplete.emit(bestFitResults.best_values)
+            logger.info('curveFit returned optimum parameters %s',
+                        bestFitResults.best_values)
+            # Plot the best curve on the graph, reusing the model
+            # curve lmfit evaluated at the optimum parameters
+            self.plotFittedGraph(bestFitResults.best_fit)
+
+            # Determine 95% confidence limits.
+            numDataPoints = len(bestFitResults.data)
+            numParams = len(bestFitResults.best_values)
+            if bestFitResults.covar.size:
+                self._CurveFitCalculate95ConfidenceLimits(numDataPoints, numParams,
+                                    bestFitResults.best_values, bestFitResults.covar)
+        except Exception as e:
+            print('Error in function FerretPlotData._completeCurveFit: ' + str(e))
+            logger.error('Error in function FerretPlotData._completeCurveFit: %s', e)
+        finally:
+            self.sigFitEnded.emit()
+
+
+    def curveFit(self):
+        """
+        This function fits the signal/time curve calculated by 
+        the model to a signal/time curve of experimental data.
+
+        The best fit is obtained by adjusting the model's 
+        input parameters. These optimum model 
+        input parameters are displayed on the GUI 
+        and  the line of best fit plotted on the graph on the GUI.
+        
+        Additionally, the 95% confidence limits of the optimal parameter values  
+        are determined.
+        """
+        modelName = None
+        try:
+            prepared = self._prepareCurveFit()
+            if prepared is None:
+                return
+            runFit, modelName = prepared
+            if FerretPlotData._WAIT_CURSOR is None:
+                FerretPlotData._WAIT_CURSOR = QCursor(QtCore.Qt.WaitCursor)
+            QApplication.setOverrideCursor(self._WAIT_CURSOR)
+            try:
+                bestFitResults = runFit()
+            finally:
+                QApplication.restoreOverrideCursor()
+            self._completeCurveFit(bestFitResults)
+        except RuntimeWarning as rtw:
+            print ("Runtime Warning : " + str(rtw))
+        except ValueError as ve:
+            print ('Value Error: curveFit with model ' + str(modelName) + ': '+ str(ve))
+            logger.error('Value Error: curveFit with model %s: %s', modelName, ve)
+        except Exception as e:
+            print('Error in function FerretPlotData.curveFit with model ' + str(modelName) + ': ' + str(e))
+            logger.error('Error in function FerretPlotData.curveFit with model %s: %s', modelName, e)
+
+
+    def curveFitAsync(self):
+        """
+        Runs the curve fit on a worker thread so the GUI stays
+        responsive during long fits.
+
+        The fit inputs are gathered on the GUI thread, only the pure
+        lmfit computation runs on the worker, and the results are
+        applied back on the GUI thread through queued signal
+        connections.  sigFitEnded is emitted when the fit has
+        finished, successfully or not.
+        """
+        try:
+            if self._fitThread is not None and self._fitThread.isRunning():
+                # a fit is already in progress
+                return
+            prepared = self._prepareCurveFit()
+            if prepared is None:
+                self.sigFitEnded.emit()
+                return
+            runFit, modelName = prepared
+            thread = QtCore.QThread(self)
+            worker = _FitWorker(runFit)
+            worker.moveToThread(thread)
+            thread.started.connect(worker.run)
+            worker.sigFitFinished.connect(self._completeCurveFit)
+            worker.sigFitFailed.connect(self._asyncFitFailed)
+            worker.sigFitFinished.connect(thread.quit)
+            worker.sigFitFailed.connect(thread.quit)
+            thread.finished.connect(worker.deleteLater)
+            thread.finished.connect(thread.deleteLater)
+            self._fitThread = thread
+            self._fitWorker = worker
+            thread.start()
+        except Exception as e:
+            print('Error in function FerretPlotData.curveFitAsync: ' + str(e))
+            logger.error('Error in function FerretPlotData.curveFitAsync: %s', e)
+            self.sigFitEnded.emit()
+
+
+    def _asyncFitFailed(self, errorMessage):
+        """Reports a fit that failed on the worker thread."""
+        print('Error in function FerretPlotData.curveFitAsync: ' + errorMessage)
+        logger.error('Error in function FerretPlotData.curveFitAsync: %s', errorMessage)
+        self.sigFitEnded.emit()
+
+
+    def _CurveFitCalculate95ConfidenceLimits(self, numDataPoints: int, 
+                                            numParams: int, 
+                                            optimumParams, 
+                                            bestFitResultsCovar):
+        """Calculates the 95% confidence limits of optimum 
+        parameter values resulting from curve fitting. 
+
+        The the 95% confidence limits are passed back to the
+        Ferret GUI for use in the creation of the PDF report
+        and for display  on the GUI.
+        
+        Input Parameters
+        ----------------
+        numDataPoints -  Number of data points to which the model is fitted.
+                Taken as the number of elements in the array of ROI data.
+        numParams - Number of model input parameters.
+        optimumParams - Array of optimum model input parameter values 
+                        resulting from curve fitting.
+        bestFitResults.covar - The estimated covariance of 
+                the values in optimumParams calculated during 
+                curve fitting.
+        """
+        try:
+            # The covariance matrix repr can be large, so skip
+            # building the message entirely when INFO is filtered out
+            if logger.isEnabledFor(logging.INFO):
+                logger.info('Function FerretPlotData._CurveFitCalculate95ConfidenceLimits called: numDataPoints =%s, numParams=%s, optimumParams=%s, bestFitResults.covar=%s',
+                            numDataPoints, numParams, optimumParams, bestFitResultsCovar)
+            alpha = 0.05 # 95% confidence interval = 100*(1-alpha)
+
+            # Names of the parameters fixed during curve fitting,
+            # collected once.  Fixed parameters have no confidence
+            # limits, so they are excluded from the calculation below
+            # and reported with empty limits instead.  Using a set for
+            # membership avoids mutating the lmfit results dictionary.
+            fixedNames = {objCheckBox.shortName
+                          for objCheckBox in self._parameterFixedCheckBoxList
+                          if objCheckBox.isChecked()}
+            varyingItems = [(key, value) for key, value in optimumParams.items()
+                            if key not in fixedNames]
+
+            numDegsOfFreedom = max(0, numDataPoints - numParams)
+
+            # student-t value for the degrees of freedom and the confidence level
+            tval = t.ppf(1.0-alpha/2., numDegsOfFreedom)
+
+            # Remove results of previous curve fitting
+            optimisedParamaterDict = {}
+            # Calculate the 95% confidence interval of every parameter
+            # allowed to vary in three vectorised operations; the loop
+            # below only packs the results into the dictionary.
+            paramValues = np.fromiter((value for key, value in varyingItems), dtype=float)
+            #np.diagonal returns a view of the covariance diagonal,
+            #avoiding the copy np.diag makes from a 2D input
+            sigmas = np.sqrt(np.diagonal(bestFitResultsCovar))
+            lowerLimits = paramValues - sigmas*tval
+            upperLimits = paramValues + sigmas*tval
+            for (key, _), paramValue, lower, upper in zip(varyingItems,
+                                                     paramValues, lowerLimits, upperLimits):
+                units = self._currentModelObject.getParameterUnits(key)
+                if units == "%":
+                    paramValue = paramValue * 100
+                    lower = lower * 100.0
+                    upper = upper * 100.0
+                optimisedParamaterDict[key] = [round(paramValue, 4),
+                                               round(lower, 4),
+                                               round(upper, 4),
+                                               units]
+
+            # Now insert fixed parameters into optimisedParameterList
+            # if there are any.
+            for fixedName in fixedNames:
+                fixedParamValue = optimumParams[fixedName]
+                units = self._currentModelObject.getParameterUnits(fixedName)
+                if units == "%":
+                    fixedParamValue = fixedParamValue * 100
+                optimisedParamaterDict[fixedName] = [fixedParamValue, '', '', units]
+            #Return results to the Ferret GUI
+            self.sigReturnOptimumParamDict.emit(optimisedParamaterDict)
+            logger.info('Leaving FerretPlotData._CurveFitCalculate95ConfidenceLimits, optimisedParamaterDict = %s', optimisedParamaterDict)
+        except RuntimeError as rte:
+            print('Runtime Error in function FerretPlotData._CurveFitCalculate95ConfidenceLimits ' + str(rte))
+            logger.error('Runtime Error in function FerretPlotData._CurveFitCalculate95ConfidenceLimits %s', rte)  
+        except Exception as e:
+            print('Error in function FerretPlotData._CurveFitCalculate95ConfidenceLimits ' + str(e))
+            logger.error('Error in function FerretPlotData._CurveFitCalculate95ConfidenceLimits %s', e)  
+    
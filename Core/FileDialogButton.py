@@ -3,9 +3,10 @@ This class module contains two custom widgets that subclass QPushButton:
     OpenFileButton - Opens an open file dialog
     SaveFileButton - Opens a save file dialog
 """
+from functools import partial
 from PyQt5.QtWidgets import  QPushButton, QFileDialog, QMessageBox
 from PyQt5 import QtCore
-from PyQt5.QtCore import pyqtSignal  
+from PyQt5.QtCore import pyqtSignal
 
 class FileFilters:
     """
@@ -18,6 +19,7 @@ class FileFilters:
     xmlFiles = '*.xml'
     pdfFiles = '*.pdf'
     pythonFiles = '*.py'
+    parquetFiles = '*.parquet'
 
 
 class OpenFileButton(QPushButton):
@@ -54,7 +56,8 @@ class OpenFileButton(QPushButton):
             self.setToolTip(toolTip)
             self.setShortcut(shortCut)
             self._defaultDirectory = defaultDirectory
-            self.clicked.connect(lambda:self.OpenFile(defaultDialogCaption,
+            #partial is lighter to dispatch than a lambda closure
+            self.clicked.connect(partial(self.OpenFile, defaultDialogCaption,
                                                             filesFilter))
         except Exception as e:
             print('Error creating OpenFileButton object: ' + str(e)) 
@@ -81,16 +84,16 @@ class OpenFileButton(QPushButton):
                 #Check the Cancel button was not clicked
                 if len(fullFilePath):
                    self.sigFileLoaded.emit(fullFilePath)
-            except IOError:
-                print ('IOError in function OpenFileButton OpenFile: cannot open file' + self.dataFileName + ' or read its data')
-                #logger.error ('IOError in function OpenFileButton OpenFile: cannot open file' + self.dataFileName + ' or read its data')
+            except IOError as ioe:
+                print ('IOError in function OpenFileButton OpenFile: cannot open file - ' + str(ioe))
+                #logger.error ('IOError in function OpenFileButton OpenFile: cannot open file - ' + str(ioe))
             except RuntimeError as re:
                 print('Runtime error in function OpenFileButton OpenFile: ' + str(re))
                 #logger.error('Runtime error in function OpenFileButton OpenFile: ' + str(re))
             except Exception as e:
-                print('Error in function OpenFileButton OpenFile: ' + str(e) + ' at line {} in the CSV file'.format( readCSV.line_num))
-                #logger.error('Error in function OpenFileButton OpenFile: ' + str(e) + ' at line {} in the CSV file'.format( readCSV.line_num))
-                QMessageBox().warning(self, "CSV data file", "Error reading CSV file at line {} - {}".format(readCSV.line_num, e), QMessageBox.Ok)
+                print('Error in function OpenFileButton OpenFile: ' + str(e))
+                #logger.error('Error in function OpenFileButton OpenFile: ' + str(e))
+                QMessageBox().warning(self, "Open file", "Error opening file - {}".format(e), QMessageBox.Ok)
 
 
 
@@ -129,7 +132,8 @@ class SaveFileButton(QPushButton):
             self.setToolTip(toolTip)
             self.setShortcut(shortCut)
             self._defaultDirectory = defaultDirectory
-            self.clicked.connect(lambda:self.SaveFile(defaultDialogCaption,
+            #partial is lighter to dispatch than a lambda closure
+            self.clicked.connect(partial(self.SaveFile, defaultDialogCaption,
                                                             filesFilter))
         except Exception as e:
             print('Error creating SaveFileButton object'+ str(e)) 
@@ -157,13 +161,13 @@ class SaveFileButton(QPushButton):
                 #Check the Cancel button was not clicked
                 if len(fullFilePath):
                    self.sigFileSaved.emit(fullFilePath)
-            except IOError:
-                print ('IOError in function SaveFileButton SaveFile: cannot open file' + self.dataFileName + ' or read its data')
-                #logger.error ('IOError in function SaveFileButton SaveFile: cannot open file' + self.dataFileName + ' or read its data')
+            except IOError as ioe:
+                print ('IOError in function SaveFileButton SaveFile: cannot open file - ' + str(ioe))
+                #logger.error ('IOError in function SaveFileButton SaveFile: cannot open file - ' + str(ioe))
             except RuntimeError as re:
                 print('Runtime error in function SaveFileButton SaveFile: ' + str(re))
                 #logger.error('Runtime error in function SaveFileButton SaveFile: ' + str(re))
             except Exception as e:
-                print('Error in function SaveFileButton SaveFile: ' + str(e) + ' at line {} in the CSV file'.format( readCSV.line_num))
-                #logger.error('Error in function SaveFileButton SaveFile: ' + str(e) + ' at line {} in the CSV file'.format( readCSV.line_num))
-                QMessageBox().warning(self, "CSV data file", "Error reading CSV file at line {} - {}".format(readCSV.line_num, e), QMessageBox.Ok)
+                print('Error in function SaveFileButton SaveFile: ' + str(e))
+                #logger.error('Error in function SaveFileButton SaveFile: ' + str(e))
+                QMessageBox().warning(self, "Save file", "Error saving file - {}".format(e), QMessageBox.Ok)
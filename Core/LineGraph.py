@@ -1,180 +1,363 @@
-from PyQt5.QtWidgets import QVBoxLayout,  QWidget
-from PyQt5.QtCore import Qt
-
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
-import matplotlib.pyplot as plt
-import logging
-logger = logging.getLogger(__name__)
-
-from InputValidation import InputValidation
-
-class NavigationToolbar(NavigationToolbar):
-    """
-    Unwanted default buttons in the Navigation Toolbar are removed by creating
-    a subclass of the NavigationToolbar class from from 
-    matplotlib.backends.backend_qt5agg import NavigationToolbar2QT.
-    Only the desired buttons are defined.
-    """
-    toolitems = [t for t in NavigationToolbar.toolitems if
-                 t[0] in ('Home', 'Pan', 'Zoom', 'Save')]
-
-
-class LineGraph(QWidget):
-    def __init__(self, plotWidth=4, plotHeight=7, 
-                 dotsPerInch=300, xLabel='time', 
-                 yLabel='signal', title=None,
-                 tickLabelSize=2,
-                 xyAxisLabelSize=2,
-                 titleSize=2,
-                 backgroundColour='w'):
-        """
-        Sets up the graph and its tool bar and places them in a vertical layout,
-        which is then added to QWidget.
-
-        If plot width = 4,  plot height = 6 and dots per inch is 75 then
-        the plot would be 300 and 450 pixels in size.
-
-        Input arguments.
-        ****************
-        plotWidth - width of the plot in inches 
-        plotHeight - height of the plot in inches 
-        dotsPerInch - number of pixels per inch 
-        xLabel - string containing the X axis label  
-        yLabel - string containing the Y axis label  
-        title  - string containing the title of the graph displayed above the graph.
-        tickLabelSize - size of the axis ticks.
-        xyAxisLabelSize - size of the X & Y axis labels.
-        titleSize - size of the title.
-        backgroundColour - optional parameter for selecting the plot background colour.
-                            default value is 'w' for white
-        """
-        try:
-            InputValidation.validatePositiveNumericVariable(plotWidth, "plotWidth")
-            InputValidation.validatePositiveNumericVariable(plotWidth, "plotWidth")
-            InputValidation.validatePositiveNumericVariable(plotHeight, "plotHeight")
-            InputValidation.validatePositiveNumericVariable(dotsPerInch, "dotsPerInch")
-            InputValidation.validatePositiveNumericVariable(tickLabelSize, "tickLabelSize")
-            InputValidation.validatePositiveNumericVariable(xyAxisLabelSize, "xyAxisLabelSize")
-            InputValidation.validatePositiveNumericVariable(titleSize, "titleSize")
-            InputValidation.validateStringVariable(xLabel, "xLabel")
-            InputValidation.validateStringVariable(yLabel, "yLabel")
-            InputValidation.validateStringVariable(title, "title")
-            InputValidation.validateStringVariable(backgroundColour, "title")
-
-            super().__init__()
-            self.figure = plt.figure(figsize=(plotWidth, plotHeight), dpi=dotsPerInch)
-            self.figure.set_visible(True)
-            #Move the plot up to make room for the x axis label
-            self.figure.subplots_adjust(bottom=0.2)
-            self.figure.tight_layout()
-            # this is the Canvas Widget that displays the `figure`
-            # it takes the `figure` instance as a parameter 
-            # to its __init__ function
-            self.canvas = FigureCanvas(self.figure)
-            self.backgroundColour = backgroundColour
-            self.xLabel = xLabel
-            self.yLabel = yLabel
-            self.title = title
-            self.tickLabelSize = tickLabelSize
-            self.xyAxisLabelSize = xyAxisLabelSize
-            self.titleSize = titleSize
-            self._setUpSubPlot()
-            self.plotLayout =  QVBoxLayout()
-            self.toolbar = NavigationToolbar(self.canvas, None)
-            self.plotLayout.addWidget(self.toolbar)
-            self.plotLayout.addWidget(self.canvas)
-            self.setLayout(self.plotLayout)
-        except Exception as e:
-            print('Error creating LineGraph object: ' + str(e)) 
-            logger.error('Error creating LineGraph object: ' + str(e))
-
-
-    def clearPlot(self):
-        """
-        Removes the existing plots from the graph
-        """
-        self.figure.clear()
-        self.canvas.draw()
-        self._setUpSubPlot()
-
-
-    def _setUpSubPlot(self):
-        """
-        This function sets up the grid and the axes of the graph
-        """
-        try:
-            logger.info('function _setUpSubPlot called.')
-            
-            #Position a sub plot in the graph's grid.
-            # "111" means "1x1 grid, first subplot"
-            self.subPlot = self.figure.add_subplot(111)
-            
-            # Set size of the x,y axis tick labels
-            self.subPlot.tick_params(axis='both', 
-                                   which='major', 
-                                   labelsize=self.tickLabelSize)
-            self.subPlot.set_facecolor(self.backgroundColour)
-            self.subPlot.set_xlabel(self.xLabel, loc='center', 
-                                    fontsize=self.xyAxisLabelSize)
-            self.subPlot.set_ylabel(self.yLabel, loc='center', 
-                                    fontsize=self.xyAxisLabelSize)
-            if self.title is not None:
-                self.subPlot.set_title(self.title, fontsize=self.titleSize)
-            #add a grid to the sub plot
-            self.subPlot.grid()
-        except Exception as e:
-            print('Error in function LineGraph _setUpSubPlot: ' + str(e))
-            logger.error('Error in function LineGraph _setUpSubPlot: ' + str(e))
-
-
-    def _setUpLegendBox(self):
-        """
-        This function draws the legend box holding the key
-        to the MR signal/time curves on the plot.
-        """
-        try:
-            logger.info('function _setUpLegendBox called.')
-            # Put a legend to the top right-hand corner of the plot
-            self.subPlot.legend(loc='upper right', 
-                                bbox_to_anchor=(0.8, 1.0), 
-                                labelspacing = 2,
-                                fontsize=self.xyAxisLabelSize,
-                                ncol=1,
-                                handlelength=1.0,
-                                handleheight=1.0)
-        except Exception as e:
-            print('Error in function LineGraph _setUpLegendBox: ' + str(e))
-            logger.error('Error in function LineGraph _setUpLegendBox: ' + str(e))
-
-
-    def plotData(self, xData, yData, lineStyle, labelText):
-        """
-        Plots a line through the data points on the graph.
-
-        Input Arguments
-        ***************
-        xData - List of X data points 
-        yData - List of Y data points
-        lineStyle - String containing the style (solid or dashed) and colour of the plot line
-        labelText - String containing the label for this plot displayed in the legend box
-        """
-        try:
-            InputValidation.validateNumpyArrayVariable(xData, "xData")
-            InputValidation.validateNumpyArrayVariable(yData, "yData")
-            InputValidation.validateStringVariable(lineStyle, "lineStyle")
-            InputValidation.validateStringVariable(labelText, "labelText")
-            self.subPlot.plot(xData, yData, lineStyle, label=labelText)
-            self._setUpLegendBox()
-            # Redraw the canvas to show the above line
-            self.canvas.draw()
-        except Exception as e:
-            print('Error in function LineGraph plotData: ' + str(e))
-            logger.error('Error in function LineGraph plotData: ' + str(e))
-
-
-    def savePlotToPDF(self, imageName):
-        """
-        Saves a copy of the graph as a PDF file to disc.
-        """
-        self.figure.savefig(fname=imageName, dpi=300)
\ No newline at end of file
+from PyQt5.QtWidgets import QVBoxLayout,  QWidget
+from PyQt5.QtCore import Qt
+
+import matplotlib as mpl
+from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
+from matplotlib.figure import Figure
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
+import numpy as np
+import logging
+logger = logging.getLogger(__name__)
+
+from InputValidation import InputValidation
+
+#Accelerate drawing of long time series: drop path segments that are
+#visually indistinguishable at screen resolution and let Agg process
+#very long lines in chunks
+mpl.rcParams['path.simplify'] = True
+mpl.rcParams['path.simplify_threshold'] = 1.0
+mpl.rcParams['agg.path.chunksize'] = 10000
+
+class NavigationToolbar(NavigationToolbar):
+    """
+    Unwanted default buttons in the Navigation Toolbar are removed by creating
+    a subclass of the NavigationToolbar class from from 
+    matplotlib.backends.backend_qt5agg import NavigationToolbar2QT.
+    Only the desired buttons are defined.
+    """
+    toolitems = [t for t in NavigationToolbar.toolitems if
+                 t[0] in ('Home', 'Pan', 'Zoom', 'Save')]
+
+
+class LineGraph(QWidget):
+    def __init__(self, plotWidth=4, plotHeight=7, 
+                 dotsPerInch=96, xLabel='time', 
+                 yLabel='signal', title=None,
+                 tickLabelSize=2,
+                 xyAxisLabelSize=2,
+                 titleSize=2,
+                 backgroundColour='w'):
+        """
+        Sets up the graph and its tool bar and places them in a vertical layout,
+        which is then added to QWidget.
+
+        If plot width = 4,  plot height = 6 and dots per inch is 75 then
+        the plot would be 300 and 450 pixels in size.
+
+        Input arguments.
+        ****************
+        plotWidth - width of the plot in inches 
+        plotHeight - height of the plot in inches 
+        dotsPerInch - number of pixels per inch 
+        xLabel - string containing the X axis label  
+        yLabel - string containing the Y axis label  
+        title  - string containing the title of the graph displayed above the graph.
+        tickLabelSize - size of the axis ticks.
+        xyAxisLabelSize - size of the X & Y axis labels.
+        titleSize - size of the title.
+        backgroundColour - optional parameter for selecting the plot background colour.
+                            default value is 'w' for white
+        """
+        try:
+            InputValidation.validatePositiveNumericVariable(plotWidth, "plotWidth")
+            InputValidation.validatePositiveNumericVariable(plotHeight, "plotHeight")
+            InputValidation.validatePositiveNumericVariable(dotsPerInch, "dotsPerInch")
+            InputValidation.validatePositiveNumericVariable(tickLabelSize, "tickLabelSize")
+            InputValidation.validatePositiveNumericVariable(xyAxisLabelSize, "xyAxisLabelSize")
+            InputValidation.validatePositiveNumericVariable(titleSize, "titleSize")
+            InputValidation.validateStringVariable(xLabel, "xLabel")
+            InputValidation.validateStringVariable(yLabel, "yLabel")
+            InputValidation.validateStringVariable(title, "title")
+            InputValidation.validateStringVariable(backgroundColour, "title")
+
+            super().__init__()
+            # Construct the Figure directly rather than via pyplot, so
+            # rendering always uses the Agg canvas attached below and
+            # the figure is not registered in pyplot's global state
+            # constrained_layout spaces the axes and labels once at
+            # construction, roughly half the cost of the iterative
+            # tight_layout solver and with no manual margin adjustment
+            self.figure = Figure(figsize=(plotWidth, plotHeight), dpi=dotsPerInch,
+                                 constrained_layout=True)
+            self.figure.set_visible(True)
+            # this is the Canvas Widget that displays the `figure`
+            # it takes the `figure` instance as a parameter 
+            # to its __init__ function
+            self.canvas = FigureCanvas(self.figure)
+            self.backgroundColour = backgroundColour
+            self.xLabel = xLabel
+            self.yLabel = yLabel
+            self.title = title
+            self.tickLabelSize = tickLabelSize
+            self.xyAxisLabelSize = xyAxisLabelSize
+            self.titleSize = titleSize
+            self._setUpSubPlot()
+            #background bitmap of the axes (grid, ticks, labels -
+            #no curves) used for blitting, plus the axis limits and
+            #canvas size it was rendered with so a stale transform or
+            #geometry is never blitted
+            self._background = None
+            self._backgroundLimits = None
+            self._backgroundSize = None
+            #a resize immediately invalidates the cached background;
+            #restore_region does not raise on a size mismatch, it
+            #silently paints the old-geometry bitmap
+            self.canvas.mpl_connect('resize_event', self._onCanvasResize)
+            #Line2D artists keyed on their legend label, so replotting
+            #a curve updates the existing line in place instead of
+            #growing the axes with a new artist
+            self._lines = {}
+            self.plotLayout =  QVBoxLayout()
+            self.toolbar = NavigationToolbar(self.canvas, None)
+            self.plotLayout.addWidget(self.toolbar)
+            self.plotLayout.addWidget(self.canvas)
+            self.setLayout(self.plotLayout)
+        except Exception as e:
+            print('Error creating LineGraph object: ' + str(e)) 
+            logger.error('Error creating LineGraph object: ' + str(e))
+
+
+    def clearPlot(self):
+        """
+        Removes the existing plots from the graph
+        """
+        self.figure.clear()
+        self._lines = {}
+        self.canvas.draw()
+        self._setUpSubPlot()
+        self._captureBackground()
+
+
+    def _captureBackground(self):
+        """
+        Caches a bitmap of the axes (grid, ticks, labels and title,
+        but no curves or legend) together with the axis limits it was
+        rendered at, so plotData can blit curves on top of it instead
+        of re-rasterising the whole figure per curve.
+
+        Must be re-run, via a full draw, whenever autoscaling changes
+        the axis limits - blitting curves through a transform that
+        differs from the cached background draws them in the wrong
+        place (or not at all).
+        """
+        try:
+            hiddenArtists = [line for line in self.subPlot.lines if line.get_visible()]
+            legend = self.subPlot.get_legend()
+            if legend is not None and legend.get_visible():
+                hiddenArtists.append(legend)
+            for artist in hiddenArtists:
+                artist.set_visible(False)
+            try:
+                self.canvas.draw()
+                self._background = self.canvas.copy_from_bbox(self.figure.bbox)
+                self._backgroundLimits = (self.subPlot.get_xlim(),
+                                          self.subPlot.get_ylim())
+                self._backgroundSize = self.canvas.get_width_height()
+            finally:
+                for artist in hiddenArtists:
+                    artist.set_visible(True)
+        except Exception:
+            self._background = None
+            self._backgroundLimits = None
+            self._backgroundSize = None
+
+
+    def _onCanvasResize(self, event):
+        """
+        Drops the cached blit background when the canvas changes
+        size - including the resizes Qt performs while settling the
+        initial layout - so the next blit recaptures it at the new
+        geometry.
+        """
+        self._background = None
+        self._backgroundLimits = None
+        self._backgroundSize = None
+
+
+    def _setUpSubPlot(self):
+        """
+        This function sets up the grid and the axes of the graph
+        """
+        try:
+            #Position a sub plot in the graph's grid.
+            # "111" means "1x1 grid, first subplot"
+            self.subPlot = self.figure.add_subplot(111)
+            
+            # Set size of the x,y axis tick labels
+            self.subPlot.tick_params(axis='both', 
+                                   which='major', 
+                                   labelsize=self.tickLabelSize)
+            self.subPlot.set_facecolor(self.backgroundColour)
+            self.subPlot.set_xlabel(self.xLabel, loc='center', 
+                                    fontsize=self.xyAxisLabelSize)
+            self.subPlot.set_ylabel(self.yLabel, loc='center', 
+                                    fontsize=self.xyAxisLabelSize)
+            if self.title is not None:
+                self.subPlot.set_title(self.title, fontsize=self.titleSize)
+            #add a grid to the sub plot
+            self.subPlot.grid()
+        except Exception as e:
+            print('Error in function LineGraph _setUpSubPlot: ' + str(e))
+            logger.error('Error in function LineGraph _setUpSubPlot: ' + str(e))
+
+
+    def _setUpLegendBox(self):
+        """
+        This function draws the legend box holding the key
+        to the MR signal/time curves on the plot.
+        """
+        try:
+            # Put a legend to the top right-hand corner of the plot
+            self.subPlot.legend(loc='upper right', 
+                                bbox_to_anchor=(0.8, 1.0), 
+                                labelspacing = 2,
+                                fontsize=self.xyAxisLabelSize,
+                                ncol=1,
+                                handlelength=1.0,
+                                handleheight=1.0)
+        except Exception as e:
+            print('Error in function LineGraph _setUpLegendBox: ' + str(e))
+            logger.error('Error in function LineGraph _setUpLegendBox: ' + str(e))
+
+
+    def plotData(self, xData, yData, lineStyle, labelText):
+        """
+        Plots a line through the data points on the graph.
+
+        Input Arguments
+        ***************
+        xData - List of X data points 
+        yData - List of Y data points
+        lineStyle - String containing the style (solid or dashed) and colour of the plot line
+        labelText - String containing the label for this plot displayed in the legend box
+        """
+        try:
+            #plotData is called once per curve on every refresh by
+            #internal callers, so no per-call argument validation -
+            #the constructor arguments are validated once instead
+            line = self._lines.get(labelText)
+            if line is None:
+                (line,) = self.subPlot.plot(xData, yData, lineStyle, label=labelText)
+                self._lines[labelText] = line
+            else:
+                #update the existing curve in place - no new artist,
+                #no legend growth
+                line.set_data(xData, yData)
+                line.set_visible(True)
+            # Apply any pending autoscale now, so the blit below never
+            # draws through a transform the cached background was not
+            # rendered with
+            self.subPlot.relim()
+            self.subPlot.autoscale_view()
+            self._blitCurves()
+        except Exception as e:
+            print('Error in function LineGraph plotData: ' + str(e))
+            logger.error('Error in function LineGraph plotData: ' + str(e))
+
+
+    def _blitCurves(self):
+        """
+        Draws the curve and legend artists onto the cached background
+        bitmap.  If the axis limits have changed since the background
+        was captured it is re-rendered first (a full draw); if no
+        background can be used at all, a normal coalesced redraw is
+        scheduled instead.
+        """
+        currentLimits = (self.subPlot.get_xlim(), self.subPlot.get_ylim())
+        if (self._background is None
+                or currentLimits != self._backgroundLimits
+                or self.canvas.get_width_height() != self._backgroundSize):
+            self._captureBackground()
+        if self._background is not None:
+            try:
+                self.canvas.restore_region(self._background)
+                for line in self.subPlot.lines:
+                    self.subPlot.draw_artist(line)
+                legend = self.subPlot.get_legend()
+                if legend is not None:
+                    self.subPlot.draw_artist(legend)
+                self.canvas.blit(self.figure.bbox)
+                return
+            except Exception:
+                #fall through to a normal redraw, e.g. after a resize
+                self._background = None
+        # Schedule a redraw to show the curves.  draw_idle coalesces
+        # consecutive plotData calls into one rasterisation when the
+        # Qt event loop next goes idle, instead of forcing a full
+        # synchronous render per curve.
+        self.canvas.draw_idle()
+
+
+    def plotDataBatch(self, xDataList, yDataList, colours, labels):
+        """
+        Plots many curves in one go using a LineCollection, which Agg
+        draws in a single pass instead of one artist per curve.
+
+        Input Arguments
+        ***************
+        xDataList - list of arrays of X data points, one per curve
+        yDataList - list of arrays of Y data points, one per curve
+        colours - list of line colours, one per curve
+        labels - list of legend labels, one per curve
+        """
+        try:
+            segments = [np.column_stack([xData, yData])
+                        for xData, yData in zip(xDataList, yDataList)]
+            collection = LineCollection(segments, colors=colours)
+            self.subPlot.add_collection(collection)
+            #proxy artists give one legend row per curve without
+            #adding per-segment artists to the axes
+            for colour, label in zip(colours, labels):
+                self.subPlot.add_line(Line2D([], [], color=colour, label=label))
+            self.subPlot.autoscale_view()
+            self.canvas.draw_idle()
+        except Exception as e:
+            print('Error in function LineGraph plotDataBatch: ' + str(e))
+            logger.error('Error in function LineGraph plotDataBatch: ' + str(e))
+
+
+    def finalizePlot(self):
+        """
+        Builds the legend once after all the curves for the current
+        refresh have been added with plotData, and schedules a redraw.
+
+        Rebuilding the legend inside plotData made legend work O(N^2)
+        over a refresh that plots N curves.
+        """
+        try:
+            self._setUpLegendBox()
+            self._blitCurves()
+        except Exception as e:
+            print('Error in function LineGraph finalizePlot: ' + str(e))
+            logger.error('Error in function LineGraph finalizePlot: ' + str(e))
+
+
+    def closeEvent(self, event):
+        """
+        Releases the figure's resources when the widget is closed, so
+        long-running sessions that open and close many graph panels do
+        not accumulate dead figures.
+        """
+        self.figure.clf()
+        self.canvas.close()
+        super().closeEvent(event)
+
+
+    def savePlotToPDF(self, imageName):
+        """
+        Saves a copy of the graph to disc.
+
+        A .pdf target is written through the PDF backend so the curves
+        are stored as vector paths - far smaller and faster to render
+        than a 300 dpi bitmap. Other targets (such as the .png that is
+        embedded in the PDF report) are rasterised at 300 dpi as
+        before.
+        """
+        if imageName.lower().endswith('.pdf'):
+            from matplotlib.backends.backend_pdf import PdfPages
+            with PdfPages(imageName) as pdfPages:
+                pdfPages.savefig(self.figure)
+        else:
+            self.figure.savefig(fname=imageName, dpi=300)
\ No newline at end of file
@@ -8,6 +8,7 @@ A model library must contain a returnModelList function and a function for each
 mathematical model.
 """
 #Python library that supports running the models
+import inspect
 import numpy as np
 #The following 2 module imports are mandatory for model definition.
 #Note that modules are imported as parentPackage.module.
@@ -16,27 +17,134 @@ import numpy as np
 #At the head of Ferret.py, the path to folder SupportModules is
 #added to sys.path, which contains a list of directories 
 #that the interpreter will search in for the required module.
-from SupportModules.Model import Model, ModelParameter, ModelConstant, ModelVariable 
+from SupportModules.Model import Model, ModelParameter, ModelConstant, ModelVariable
 from SupportModules.GraphSupport import LineColours
+from SupportModules.ConstantsSupport import parseConstantsString
+from SupportModules.JitSupport import maybe_njit, numbaAvailable
+
+class MemoFun:
+    """
+    Memoizes a model function.
+
+    Curve fitting calls the model function with an identical argument
+    set several times per fit (the initial check plus the base point of
+    each finite-difference probe), so the previous result is returned
+    when nothing has changed.  The wrapped function's name and
+    signature are preserved so lmfit can still introspect the
+    parameter names.
+    """
+    def __init__(self, modelFunction):
+        self._modelFunction = modelFunction
+        self._lastKey = None
+        self._lastArguments = None  #holds references so array ids stay unique
+        self._lastResult = None
+        self.__name__ = modelFunction.__name__
+        self.__signature__ = inspect.signature(modelFunction)
+
+    def __call__(self, *args, **kwargs):
+        bound = self.__signature__.bind(*args, **kwargs)
+        bound.apply_defaults()
+        #arrays are keyed by identity - cheap, and safe because the
+        #previous argument set is kept alive above
+        key = tuple((name, id(value) if isinstance(value, np.ndarray) else value)
+                    for name, value in bound.arguments.items())
+        if key == self._lastKey:
+            return self._lastResult
+        result = self._modelFunction(*args, **kwargs)
+        self._lastKey = key
+        self._lastArguments = list(bound.arguments.values())
+        self._lastResult = result
+        return result
+
 
 #*********************************************************************************
 #** Models
 #*********************************************************************************
-def quadraticModel(inputData, a, b, constantsString):
+def quadraticModel(inputData, a, b, constantsString, cache=None, changed=None):
     #y = ax^2 + bx + c
-    constantsDict = eval(constantsString) 
+    #a*x*x avoids the extra temporary that x**2 allocates.
+    #The cache/changed keyword arguments opt this model in to the
+    #per-parameter dependency cache of Model.evaluate: the a*x*x term
+    #is reused while only b or the constants change.  lmfit ignores
+    #the two extra arguments, so curve fitting is unaffected.
+    constantsDict = parseConstantsString(constantsString)
     c = float(constantsDict['c'])
-    return np.multiply((inputData**2),a) + np.multiply(inputData, b) + c
+    x = inputData
+    if cache is None:
+        return a*x*x + b*x + c
+    #the input array is kept in the cache so the identity test below
+    #cannot be fooled by id reuse
+    if changed[0] or cache.get('inputData') is not x:
+        cache['inputData'] = x
+        cache['aTimesXSquared'] = a*x*x
+    return cache['aTimesXSquared'] + b*x + c
 
 
 def straightLineModel(inputData, m, constantsString):
-    constantsDict = eval(constantsString) 
+    constantsDict = parseConstantsString(constantsString)
     c = float(constantsDict['c'])
-    return np.multiply(inputData,m) + c
+    return m*inputData + c
+
+
+def linearJacobian(params, *args, **kwargs):
+    """
+    Analytic Jacobian of the linear model for the Levenberg-Marquardt
+    backend (see the modelJacobian argument of the Model class).
+
+    It receives the lmfit Parameters followed by the fit's data and
+    independent variables, and returns the derivatives of the residual
+    with respect to a and b, one parameter per row (col_deriv=True).
+    lmfit's model residual is data - model, hence the negated model
+    derivatives -x and -1; no model evaluation is needed.
+    """
+    x = kwargs['inputData']
+    jacobian = np.empty((2, x.size))
+    jacobian[0] = -x    #d/da
+    jacobian[1] = -1.0  #d/db
+    return jacobian
+
+
+if numbaAvailable:
+    @maybe_njit
+    def _linearKernel(x, a, b):
+        #explicit loop compiles to a single fused multiply-add pass
+        #with no temporary arrays.  numba specialises the kernel per
+        #input dtype, so float32 data is processed - and stored - as
+        #float32, halving memory traffic against float64
+        out = np.empty_like(x)
+        for i in range(x.shape[0]):
+            out[i] = a*x[i] + b
+        return out
+else:
+    def _linearKernel(x, a, b):
+        #coerce the scalars to the data dtype so float32 input is not
+        #silently promoted to float64, and add in place so the call
+        #makes one allocation instead of two.  The output is a fresh
+        #array each call because callers (plot lines, caches, the
+        #export list) keep references to previous results.
+        dtype = x.dtype.type
+        out = np.multiply(x, dtype(a))
+        np.add(out, dtype(b), out=out)
+        return out
 
 
 def linearModel(inputData, a, b, constantsString=None):
-    return np.multiply(inputData,a) + b
+    return _linearKernel(inputData, a, b)
+
+
+def linearModelGrid(inputData, aValues, bValues):
+    """
+    Evaluates the linear model for a whole grid of candidate (a, b)
+    pairs in one broadcasted operation.
+
+    Useful for previewing how the curve shape changes over a range of
+    parameter values: the result has one row per (a, b) pair, so a
+    slider sweep becomes O(1) row indexing instead of one model call
+    per tick.
+    """
+    aValues = np.asarray(aValues, dtype=np.float64)
+    bValues = np.asarray(bValues, dtype=np.float64)
+    return inputData[None, :]*aValues[:, None] + bValues[:, None]
 
 #*******************************************************************************
 #** Define parameters for the model
@@ -166,43 +274,48 @@ def setUpVariablesForAllModels():
     return variablesList
 
 
+#The model objects are built once at module load, so repeated calls
+#to returnModelList do not re-run the parameter/variable set-up
+#functions and re-allocate their objects
+_linearModel = Model(shortName='Linear',
+                 longName ='Linear',
+                 xDataInputOnly = True,
+                 modelFunction = MemoFun(linearModel),
+                 modelJacobian = linearJacobian,
+                 parameterList = setUpParametersForLinearModel(),
+                 variablesList = setUpVariablesForAllModels(),
+                 returnMessageFunction=None
+                 )
+
+_straightLineModel = Model(shortName='Straight Line',
+                     longName='Straight Line',
+                     xDataInputOnly = True,
+                     modelFunction = straightLineModel,
+                     parameterList = setUpParameterForStraightLineModel(),
+                     variablesList = setUpVariablesForAllModels(),
+                     constantsList = setUpConstantForYAxisIntersection(),
+                     returnMessageFunction=None)
+
+_quadraticModel = Model(shortName='Quadratic',
+                     longName='Quadratic',
+                     xDataInputOnly = True,
+                     modelFunction = quadraticModel,
+                     parameterList = setUpParametersForQuadraticModel(),
+                     variablesList = setUpVariablesForAllModels(),
+                     constantsList = setUpConstantForYAxisIntersection(),
+                     returnMessageFunction=None)
+
+
 def returnModelList():
     """
     This mandatory function returns a list of Model objects.
 
     Every model library module must contain an implementation of this function.
 
-    An object is created for each mathematic model using the Model class 
-    and added to the list, that is returned by this function.
+    The model objects are module-level constants built once at load
+    time, so this function simply hands them out.
     """
-    linear = Model(shortName='Linear', 
-                     longName ='Linear', 
-                     xDataInputOnly = True,
-                     modelFunction = linearModel,
-                     parameterList = setUpParametersForLinearModel(), 
-                     variablesList = setUpVariablesForAllModels(),
-                     returnMessageFunction=None
-                     )
-
-    straightLine = Model(shortName='Straight Line',
-                         longName='Straight Line',
-                         xDataInputOnly = True,
-                         modelFunction = straightLineModel,
-                         parameterList = setUpParameterForStraightLineModel(), 
-                         variablesList = setUpVariablesForAllModels(),
-                         constantsList = setUpConstantForYAxisIntersection(),
-                         returnMessageFunction=None)
-
-    quadratic = Model(shortName='Quadratic',
-                         longName='Quadratic',
-                         xDataInputOnly = True,
-                         modelFunction = quadraticModel,
-                         parameterList = setUpParametersForQuadraticModel(), 
-                         variablesList = setUpVariablesForAllModels(),
-                         constantsList = setUpConstantForYAxisIntersection(),
-                         returnMessageFunction=None)
-   
-    return[linear, straightLine, quadratic]
+    return [_linearModel, _straightLineModel, _quadraticModel]
 
 
 def returnDataFileFolder():
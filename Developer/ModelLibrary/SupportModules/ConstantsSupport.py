@@ -0,0 +1,21 @@
+"""
+This module supports unpacking the constantsString argument that
+Ferret passes to every model function.
+"""
+from ast import literal_eval
+from functools import lru_cache
+
+
+@lru_cache(maxsize=32)
+def parseConstantsString(constantsString):
+    """
+    Returns the dictionary of constant name:value pairs encoded in
+    constantsString.
+
+    During curve fitting the model function is called hundreds of
+    times with the identical string, so the parsed dictionary is
+    cached.  literal_eval is used in place of eval so that the string
+    cannot execute arbitrary code.  Callers must not mutate the
+    returned dictionary, as it is shared between calls.
+    """
+    return literal_eval(constantsString)
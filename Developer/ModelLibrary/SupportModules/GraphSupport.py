@@ -1,37 +1,66 @@
-class PlotBackgroundColour:
-    """
-    This class provides constants for the selection of the plot
-    background colour
-    """
-    blue = 'b'
-    green = 'g'
-    red = 'r'
-    cyan = 'c'
-    magenta = 'm'
-    yellow = 'y'
-    black = 'k'
-    white = 'w'
-
-
-class LineColours:
-     """
-     This class provides constants for the selection of graph line
-     style (solid line or dashed) and line colour.
-     """
-     blueDashed = 'b--'
-     greenDashed = 'g--'
-     redDashed ='r--'
-     cyanDashed = 'c--'
-     magentaDashed = 'm--'
-     yellowDashed = 'y--'
-     blackDashed = 'k--'
-     whiteDashed = 'w--'
-
-     blueLine = 'b.-'
-     greenLine = 'g.-'
-     redLine = 'r.-'
-     cyanLine = 'c.-'
-     magentaLine = 'm.-'
-     yellowLine = 'y.-'
-     blackLine = 'k.-'
-     whiteLine = 'w.-'
+import sys
+from typing import Final
+
+#Graph line style/colour codes as module-level interned constants.
+#Interning makes downstream equality checks on these codes pointer
+#comparisons rather than character-by-character string compares.
+BLUE_DASHED: Final[str] = sys.intern('b--')
+GREEN_DASHED: Final[str] = sys.intern('g--')
+RED_DASHED: Final[str] = sys.intern('r--')
+CYAN_DASHED: Final[str] = sys.intern('c--')
+MAGENTA_DASHED: Final[str] = sys.intern('m--')
+YELLOW_DASHED: Final[str] = sys.intern('y--')
+BLACK_DASHED: Final[str] = sys.intern('k--')
+WHITE_DASHED: Final[str] = sys.intern('w--')
+
+BLUE_LINE: Final[str] = sys.intern('b.-')
+GREEN_LINE: Final[str] = sys.intern('g.-')
+RED_LINE: Final[str] = sys.intern('r.-')
+CYAN_LINE: Final[str] = sys.intern('c.-')
+MAGENTA_LINE: Final[str] = sys.intern('m.-')
+YELLOW_LINE: Final[str] = sys.intern('y.-')
+BLACK_LINE: Final[str] = sys.intern('k.-')
+WHITE_LINE: Final[str] = sys.intern('w.-')
+
+
+class PlotBackgroundColour:
+    """
+    This class provides constants for the selection of the plot
+    background colour
+    """
+    blue = 'b'
+    green = 'g'
+    red = 'r'
+    cyan = 'c'
+    magenta = 'm'
+    yellow = 'y'
+    black = 'k'
+    white = 'w'
+
+
+class LineColours:
+     """
+     This class provides constants for the selection of graph line
+     style (solid line or dashed) and line colour.
+
+     The values alias the module-level interned constants above and
+     are kept for backward compatibility with existing model
+     libraries.
+     """
+     blueDashed = BLUE_DASHED
+     greenDashed = GREEN_DASHED
+     redDashed = RED_DASHED
+     cyanDashed = CYAN_DASHED
+     magentaDashed = MAGENTA_DASHED
+     yellowDashed = YELLOW_DASHED
+     blackDashed = BLACK_DASHED
+     whiteDashed = WHITE_DASHED
+
+     blueLine = BLUE_LINE
+     greenLine = GREEN_LINE
+     redLine = RED_LINE
+     cyanLine = CYAN_LINE
+     magentaLine = MAGENTA_LINE
+     yellowLine = YELLOW_LINE
+     blackLine = BLACK_LINE
+     whiteLine = WHITE_LINE
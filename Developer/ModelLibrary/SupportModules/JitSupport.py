@@ -0,0 +1,34 @@
+"""
+This module provides optional JIT compilation of model functions
+with numba.
+
+numba is not a required dependency of Ferret.  When it is installed,
+maybe_njit compiles the decorated model function to machine code,
+which removes the Python interpreter overhead from the innermost
+curve-fitting loop.  When numba is not installed, maybe_njit returns
+the function unchanged, so model libraries can opt in without caring
+whether numba is available.
+
+A model function that opts in must be numba-compatible: numeric
+array/scalar arguments only, so the constantsString argument must be
+unpacked outside the compiled kernel.
+"""
+try:
+    from numba import njit
+
+    #True when numba is installed, so callers can choose between an
+    #explicit-loop kernel (fastest compiled) and a vectorised numpy
+    #fallback (fastest interpreted)
+    numbaAvailable = True
+
+    def maybe_njit(func):
+        """Compiles func with numba when available."""
+        return njit(cache=True, fastmath=True)(func)
+
+except ImportError:
+
+    numbaAvailable = False
+
+    def maybe_njit(func):
+        """numba is not installed - returns func unchanged."""
+        return func
@@ -0,0 +1,51 @@
+"""
+This module contains the numeric kernels on the SPGR model fitting
+hot path, written so that they can be JIT compiled with numba via
+the maybe_njit shim in JitSupport.py.
+
+The kernels are pure numeric functions of arrays and scalars - no
+logging, no string arguments - which is what numba's nopython mode
+requires.  When numba is not installed they run as ordinary Python,
+identical in behaviour to the originals in MathsTools.py.
+"""
+import numpy as np
+from JitSupport import maybe_njit
+
+
+@maybe_njit
+def expconv(T, t, a):
+    """
+    Performs convolution of (1/T)exp(-t/T) with a.
+
+    This is the recurrence from MathsTools.expconv with the logging
+    and model-name argument stripped so the loop can be compiled to
+    machine code.
+    """
+    n = len(t)
+    f = np.zeros((n,))
+
+    x = (t[1:n-1] - t[0:n-2])/T
+    da = (a[1:n-1] - a[0:n-2])/x
+
+    E = np.exp(-x)
+    E0 = 1-E
+    E1 = x-E0
+
+    add = a[0:n-2]*E0 + da*E1
+
+    for i in range(0, n-2):
+        f[i+1] = E[i]*f[i] + add[i]
+
+    f[n-1] = f[n-2]
+    return f
+
+
+@maybe_njit
+def assembleTissueConcentration(Ve, Khe, Kbh, ce, t):
+    """
+    Assembles the tissue concentration ct from the extracellular
+    concentration ce for the two-compartment filtration model, fusing
+    the expconv convolution with the mixing arithmetic.
+    """
+    Th = (1.0-Ve)/Kbh
+    return Ve*ce + Khe*Th*expconv(Th, t, ce)